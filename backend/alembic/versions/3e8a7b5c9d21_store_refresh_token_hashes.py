@@ -0,0 +1,58 @@
+"""store refresh token hashes
+
+Revision ID: 3e8a7b5c9d21
+Revises: 9c3f1a6d2e84
+Create Date: 2026-10-15 15:34:08.551276
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8a7b5c9d21"
+down_revision: Union[str, Sequence[str], None] = "9c3f1a6d2e84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens", sa.Column("token_hash", sa.LargeBinary(32), nullable=True)
+    )
+    # Existing sessions stay valid: hash the stored tokens in place.
+    op.execute(
+        "UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))"
+    )
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.create_index(
+        "ix_refresh_tokens_token_hash",
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+        postgresql_include=["is_revoked", "expires_at", "user_id"],
+    )
+    op.drop_index("ix_refresh_tokens_token", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens can't be recovered from their hashes, so existing refresh
+    # tokens are dropped and users have to sign in again.
+    op.execute("DELETE FROM refresh_tokens")
+    op.add_column(
+        "refresh_tokens", sa.Column("token", sa.String(length=500), nullable=False)
+    )
+    op.create_index(
+        "ix_refresh_tokens_token",
+        "refresh_tokens",
+        ["token"],
+        unique=True,
+        postgresql_include=["is_revoked", "expires_at", "user_id"],
+    )
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "token_hash")
@@ -0,0 +1,75 @@
+"""convert id columns to native uuid
+
+Revision ID: 5b2d9e7c41f3
+Revises: 020c681594a6
+Create Date: 2026-10-15 15:02:11.204517
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2d9e7c41f3"
+down_revision: Union[str, Sequence[str], None] = "020c681594a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table, ondelete)
+FOREIGN_KEYS = [
+    ("workflows", "owner_id", "users", "CASCADE"),
+    ("refresh_tokens", "user_id", "users", "CASCADE"),
+    ("usage_records", "user_id", "users", "CASCADE"),
+    ("usage_records", "workflow_id", "workflows", "SET NULL"),
+    ("usage_records", "run_id", "workflow_runs", "SET NULL"),
+    ("workflow_runs", "workflow_id", "workflows", "CASCADE"),
+    ("node_execution_logs", "run_id", "workflow_runs", "CASCADE"),
+]
+
+PRIMARY_KEY_TABLES = [
+    "users",
+    "workflows",
+    "workflow_runs",
+    "node_execution_logs",
+    "refresh_tokens",
+    "usage_records",
+]
+
+
+def _convert(to_type: sa.types.TypeEngine, using: str) -> None:
+    # Foreign keys must be dropped while both sides change type.
+    for table, column, referred, _ in FOREIGN_KEYS:
+        op.drop_constraint(f"{table}_{column}_fkey", table, type_="foreignkey")
+
+    columns = [(table, "id") for table in PRIMARY_KEY_TABLES]
+    columns += [(table, column) for table, column, _, _ in FOREIGN_KEYS]
+    for table, column in columns:
+        op.alter_column(
+            table,
+            column,
+            type_=to_type,
+            postgresql_using=using.format(column=column),
+        )
+
+    for table, column, referred, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            f"{table}_{column}_fkey",
+            table,
+            referred,
+            [column],
+            ["id"],
+            ondelete=ondelete,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert(postgresql.UUID(as_uuid=False), "{column}::uuid")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert(sa.String(length=36), "{column}::text")
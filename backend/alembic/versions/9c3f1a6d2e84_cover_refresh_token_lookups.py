@@ -0,0 +1,41 @@
+"""cover refresh token lookups
+
+Revision ID: 9c3f1a6d2e84
+Revises: 5b2d9e7c41f3
+Create Date: 2026-10-15 15:21:47.918302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3f1a6d2e84"
+down_revision: Union[str, Sequence[str], None] = "5b2d9e7c41f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_token_index(include: str) -> None:
+    # Build the replacement alongside the old index without locking out
+    # writes, then swap it in under the original name.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY ix_refresh_tokens_token_new "
+            f"ON refresh_tokens (token){include}"
+        )
+        op.execute("DROP INDEX CONCURRENTLY ix_refresh_tokens_token")
+        op.execute(
+            "ALTER INDEX ix_refresh_tokens_token_new RENAME TO ix_refresh_tokens_token"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_token_index(" INCLUDE (is_revoked, expires_at, user_id)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_token_index("")
@@ -1,47 +1,93 @@
 # backend/app/core/auth.py
 
-from datetime import datetime, timedelta, timezone
-
-from jose import JWTError, jwt
-
-from app.core.config import settings
+import hashlib
+import hmac
+import threading
+import time
+import uuid
+
+import jwt
+import orjson
+from cachetools import TTLCache
+from jwt import DecodeError, InvalidTokenError, PyJWTError
+
+from app.core.config import (
+    ACCESS_TOKEN_EXPIRE_SECONDS,
+    JWT_ALGORITHM,
+    JWT_SECRET_KEY_BYTES,
+    REFRESH_TOKEN_EXPIRE_SECONDS,
+)
 
 # Token types
 ACCESS_TOKEN_TYPE = "access"
 REFRESH_TOKEN_TYPE = "refresh"
 
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
+
+# Decoder options, fixed at construction so decode() never has to merge them.
+# Every token we mint carries these claims; the access-token cache relies on exp.
+_JWT_OPTIONS = {"require": ["exp", "iat", "sub"]}
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with the claims set serialized by orjson instead of stdlib json."""
+
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict) -> dict:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT(options=_JWT_OPTIONS)
+
+# Recently verified access tokens, keyed by SHA-256 of the token (never the
+# raw token). Entries live for at most a few seconds and never past the
+# token's own expiry, so repeat requests skip the signature check.
+ACCESS_TOKEN_CACHE_TTL_SECONDS = 5
+_access_token_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=ACCESS_TOKEN_CACHE_TTL_SECONDS
+)
+_access_token_cache_lock = threading.Lock()
+
 
 def create_access_token(user_id: str, email: str) -> str:
     """Create a short-lived access token."""
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    now = int(time.time())
     payload = {
         "sub": user_id,
         "email": email,
         "type": ACCESS_TOKEN_TYPE,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + ACCESS_TOKEN_EXPIRE_SECONDS,
+        "iat": now,
     }
-    return jwt.encode(
-        payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    return _jwt.encode(payload, JWT_SECRET_KEY_BYTES, algorithm=JWT_ALGORITHM)
+
 
+def create_refresh_token(user_id: str) -> tuple[str, str]:
+    """
+    Create a long-lived refresh token.
 
-def create_refresh_token(user_id: str) -> str:
-    """Create a long-lived refresh token."""
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-    )
+    The jti claim makes every token unique and identifies it for revocation.
+    Returns (token, jti).
+    """
+    now = int(time.time())
+    jti = uuid.uuid4().hex
     payload = {
         "sub": user_id,
         "type": REFRESH_TOKEN_TYPE,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + REFRESH_TOKEN_EXPIRE_SECONDS,
+        "iat": now,
+        "jti": jti,
     }
-    return jwt.encode(
-        payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    token = _jwt.encode(payload, JWT_SECRET_KEY_BYTES, algorithm=JWT_ALGORITHM)
+    return token, jti
 
 
 def decode_token(token: str) -> dict:
@@ -49,31 +95,65 @@ def decode_token(token: str) -> dict:
     Decode and validate a JWT token.
 
     Returns the payload dict if valid.
-    Raises JWTError if invalid or expired.
+    Raises PyJWTError if invalid or expired.
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+        payload = _jwt.decode(token, JWT_SECRET_KEY_BYTES, algorithms=_JWT_ALGORITHMS)
         return payload
-    except JWTError:
+    except PyJWTError:
         raise
 
 
+def _has_token_type(payload: dict, expected: str) -> bool:
+    """Constant-time check of the 'type' claim against the expected token type."""
+    token_type = payload.get("type")
+    if not isinstance(token_type, str):
+        return False
+    return hmac.compare_digest(token_type.encode(), expected.encode())
+
+
+def _access_token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_cached_access_token(token: str) -> dict | None:
+    """
+    Return the payload of a recently verified access token, if still cached.
+
+    Cheap enough to call on the event loop; returns None on a cache miss.
+    """
+    with _access_token_cache_lock:
+        cached = _access_token_cache.get(_access_token_cache_key(token))
+    if cached is None:
+        return None
+    payload, cached_until = cached
+    if cached_until <= time.time():
+        return None
+    return payload
+
+
 def verify_access_token(token: str) -> dict:
     """
     Decode an access token and verify it is the correct type.
 
+    Successful results are cached briefly, keyed by a hash of the token.
+
     Returns the payload with 'sub' (user_id) and 'email'.
-    Raises JWTError if invalid, expired, or wrong token type.
+    Raises PyJWTError if invalid, expired, or wrong token type.
     """
+    cached = get_cached_access_token(token)
+    if cached is not None:
+        return cached
+
     payload = decode_token(token)
-    if payload.get("type") != ACCESS_TOKEN_TYPE:
-        raise JWTError("Invalid token type: expected access token")
+    if not _has_token_type(payload, ACCESS_TOKEN_TYPE):
+        raise InvalidTokenError("Invalid token type: expected access token")
     if "sub" not in payload:
-        raise JWTError("Token missing subject claim")
+        raise InvalidTokenError("Token missing subject claim")
+
+    cached_until = min(payload["exp"], time.time() + ACCESS_TOKEN_CACHE_TTL_SECONDS)
+    with _access_token_cache_lock:
+        _access_token_cache[_access_token_cache_key(token)] = (payload, cached_until)
     return payload
 
 
@@ -82,11 +162,11 @@ def verify_refresh_token(token: str) -> dict:
     Decode a refresh token and verify it is the correct type.
 
     Returns the payload with 'sub' (user_id).
-    Raises JWTError if invalid, expired, or wrong token type.
+    Raises PyJWTError if invalid, expired, or wrong token type.
     """
     payload = decode_token(token)
-    if payload.get("type") != REFRESH_TOKEN_TYPE:
-        raise JWTError("Invalid token type: expected refresh token")
+    if not _has_token_type(payload, REFRESH_TOKEN_TYPE):
+        raise InvalidTokenError("Invalid token type: expected refresh token")
     if "sub" not in payload:
-        raise JWTError("Token missing subject claim")
+        raise InvalidTokenError("Token missing subject claim")
     return payload
@@ -0,0 +1,91 @@
+# backend/app/core/cors.py
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALLOWED_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+class FrontendCORSMiddleware:
+    """
+    CORS for a single allowed origin (the frontend), with credentials,
+    all methods and all request headers allowed.
+
+    A drop-in replacement for Starlette's CORSMiddleware configured with
+    allow_origins=[FRONTEND_URL], allow_credentials=True and "*" for
+    methods and headers. Every response header is precomputed, so a request
+    costs one scan of the request headers and one bytes comparison.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origin: str) -> None:
+        self.app = app
+        self.allow_origin = allow_origin.encode("latin-1")
+        self.simple_headers = (
+            (b"access-control-allow-origin", self.allow_origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        )
+        self.preflight_headers = (
+            *self.simple_headers,
+            (b"access-control-allow-methods", ALLOWED_METHODS),
+            (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if origin != self.allow_origin:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *self.simple_headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self, origin: bytes, request_headers: bytes | None, send: Send
+    ) -> None:
+        if origin != self.allow_origin:
+            body = b"Disallowed CORS origin"
+            headers = [(b"content-type", b"text/plain; charset=utf-8")]
+            status = 400
+        else:
+            body = b"OK"
+            headers = list(self.preflight_headers)
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            status = 200
+
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
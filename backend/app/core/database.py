@@ -9,9 +9,26 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
+    # Sized for 2 uvicorn workers plus the Celery workers within Postgres'
+    # default max_connections=100
+    pool_size=10,
+    max_overflow=20,
+    # No liveness round-trip on every checkout. After a disconnect error
+    # SQLAlchemy invalidates the pool, and recycling drops connections before
+    # idle timeouts on the server or proxies can kill them.
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    # Hand out the most recently used connection, so a few stay warm and the
+    # rest idle rather than rotating through the whole pool
+    pool_use_lifo=True,
+    # Compiled-SQL cache shared by all connections (SQLAlchemy default: 500)
+    query_cache_size=1200,
+    connect_args={
+        # Per-connection prepared statements kept by the asyncpg dialect
+        # and by asyncpg itself (defaults: 100)
+        "prepared_statement_cache_size": 1000,
+        "statement_cache_size": 1000,
+    },
 )
 
 async_session_factory = async_sessionmaker(
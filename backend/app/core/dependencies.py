@@ -1,55 +1,96 @@
 # backend/app/core/dependencies.py
 
-from fastapi import Depends
+import re
+from typing import Annotated
+
+from fastapi import Depends, Path
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
-from sqlalchemy import select
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import verify_access_token
+from app.core.auth import get_cached_access_token, verify_access_token
 from app.core.database import get_db
 from app.core.exceptions import SynthFlowException
+from app.core.user_cache import AuthenticatedUser, get_user_snapshot
 from app.models.user import User
 
 # HTTPBearer extracts the token from the "Authorization: Bearer <token>" header
 security = HTTPBearer()
 
+# Path parameter for resource ids. Id columns are native uuid, so malformed
+# values are rejected here (422) instead of failing inside the database.
+UUID_PATTERN = (
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+ResourceId = Annotated[str, Path(pattern=UUID_PATTERN)]
+_uuid_re = re.compile(UUID_PATTERN)
+
 
 class UnauthorizedException(SynthFlowException):
     def __init__(self, message: str = "Invalid or expired access token"):
         super().__init__(message=message, status_code=401)
 
 
-async def get_current_user(
+async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+) -> str:
     """
-    FastAPI dependency that:
-    1. Extracts the Bearer token from the Authorization header
-    2. Decodes and validates the JWT
-    3. Fetches the user from the database
-    4. Returns the User object
+    FastAPI dependency that extracts the Bearer token, validates the JWT
+    and returns the user id from its subject claim.
 
-    Raises 401 if token is missing, invalid, expired, or user not found.
+    Raises 401 if the token is missing, invalid or expired.
     """
     token = credentials.credentials
 
-    # Step 1: Decode and validate JWT
-    try:
-        payload = verify_access_token(token)
-    except JWTError:
-        raise UnauthorizedException()
+    # Cache hits are served on the event loop; only a full signature check
+    # is pushed to the threadpool.
+    payload = get_cached_access_token(token)
+    if payload is None:
+        try:
+            payload = await run_in_threadpool(verify_access_token, token)
+        except PyJWTError:
+            raise UnauthorizedException()
 
     user_id = payload.get("sub")
     if not user_id:
         raise UnauthorizedException("Token missing user identifier")
+    if not _uuid_re.match(user_id):
+        raise UnauthorizedException("Invalid user identifier")
 
-    # Step 2: Fetch user from database
-    query = select(User).where(User.id == user_id)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    return user_id
 
+
+async def get_current_user(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> AuthenticatedUser:
+    """
+    FastAPI dependency that:
+    1. Validates the Bearer token (see get_current_user_id)
+    2. Returns the cached user snapshot if one is still fresh
+    3. Otherwise selects the snapshot columns from the database and caches them
+
+    Raises 401 if token is missing, invalid, expired, or user not found.
+    """
+    user = await get_user_snapshot(db, user_id)
+    if user is None:
+        raise UnauthorizedException("User not found")
+
+    return user
+
+
+async def get_current_user_full(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    FastAPI dependency that returns the authenticated user as a
+    session-bound User model, for handlers that modify the user.
+
+    Raises 401 if token is missing, invalid, expired, or user not found.
+    """
+    user = await db.get(User, user_id)
     if user is None:
         raise UnauthorizedException("User not found")
 
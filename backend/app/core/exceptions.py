@@ -1,7 +1,7 @@
 # backend/app/core/exceptions.py
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 
 class SynthFlowException(Exception):
@@ -39,11 +39,13 @@ class UsageLimitExceededException(SynthFlowException):
         )
 
 
-async def synthflow_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def synthflow_exception_handler(
+    request: Request, exc: Exception
+) -> ORJSONResponse:
     sf_exc = (
         exc if isinstance(exc, SynthFlowException) else SynthFlowException(str(exc))
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=sf_exc.status_code,
         content={
             "error": {
@@ -54,8 +56,8 @@ async def synthflow_exception_handler(request: Request, exc: Exception) -> JSONR
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    return JSONResponse(
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -0,0 +1,41 @@
+# backend/app/core/http_clients.py
+
+import httpx
+
+# Built once: loading the CA bundle is the expensive part of creating a client.
+_ssl_context = httpx.create_ssl_context()
+
+# Shared client for Google's OAuth endpoints. Reusing it keeps connections
+# alive, so logins skip the TCP + TLS handshake to googleapis.com.
+google_client: httpx.AsyncClient | None = None
+
+
+def _new_google_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=10.0,
+        verify=_ssl_context,
+    )
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP clients. Called on API startup."""
+    global google_client
+    if google_client is None:
+        google_client = _new_google_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients. Called on API shutdown."""
+    global google_client
+    if google_client is not None:
+        await google_client.aclose()
+        google_client = None
+
+
+def get_google_client() -> httpx.AsyncClient:
+    """Get the shared Google client, creating it if startup didn't run."""
+    global google_client
+    if google_client is None:
+        google_client = _new_google_client()
+    return google_client
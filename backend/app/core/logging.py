@@ -1,13 +1,38 @@
 # backend/app/core/logging.py
 
+import atexit
 import logging
+import queue
 import sys
 import uuid
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 
 from app.core.config import settings
 
+_listener: QueueListener | None = None
+
+
+class _StructlogQueueHandler(QueueHandler):
+    """
+    Enqueue records untouched.
+
+    The default prepare() formats the record on the calling thread, which
+    is exactly the work we want off the hot path; structlog's event dict
+    also has to reach the ProcessorFormatter intact.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _capture_exc_info(logger, method_name: str, event_dict: dict) -> dict:
+    """Resolve exc_info=True while still on the thread handling the exception."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
 
 def setup_logging() -> None:
     """
@@ -15,22 +40,32 @@ def setup_logging() -> None:
 
     In development: colored, human-readable console output.
     In production: JSON output for log aggregation.
+
+    Events below INFO are dropped by the bound logger itself. Callers only
+    enqueue records; rendering and writing to stdout happen on a background
+    QueueListener thread.
     """
+    global _listener
+
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
+        _capture_exc_info,
         structlog.processors.UnicodeDecoder(),
     ]
 
     if settings.ENVIRONMENT == "production":
         # JSON output for production
-        renderer = structlog.processors.JSONRenderer()
+        renderers = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ]
     else:
         # Colored console output for development
-        renderer = structlog.dev.ConsoleRenderer(colors=True)
+        renderers = [structlog.dev.ConsoleRenderer(colors=True)]
 
     structlog.configure(
         processors=[
@@ -38,23 +73,31 @@ def setup_logging() -> None:
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below INFO return immediately, before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         cache_logger_on_first_use=True,
     )
 
     formatter = structlog.stdlib.ProcessorFormatter(
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            renderer,
+            *renderers,
         ],
     )
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
+    if _listener is not None:
+        _listener.stop()
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_StructlogQueueHandler(log_queue))
     root_logger.setLevel(logging.INFO)
 
     # Quiet down noisy libraries
@@ -0,0 +1,18 @@
+# backend/app/core/responses.py
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCJSONResponse(ORJSONResponse):
+    """
+    orjson response that writes UTC datetimes with a 'Z' suffix.
+
+    Matches Pydantic's datetime output, so handlers can return plain dicts
+    and skip response-model validation without changing the wire format.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
@@ -0,0 +1,95 @@
+# backend/app/core/token_revocation.py
+
+import asyncio
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.pubsub import get_async_redis
+
+logger = structlog.get_logger()
+
+# Redis key prefix for active (issued, not revoked) refresh tokens, followed
+# by the token's jti. Keys expire together with the token itself. Redis may
+# evict or lose them at any time, so a missing key only means "ask the
+# database", never "not revoked".
+ACTIVE_KEY_PREFIX = "refresh:active:"
+
+# Session.info key for (jti, ttl) markers waiting for the transaction to commit
+_PENDING_ACTIVATIONS = "refresh_token_activations"
+
+# Marker writes started by a commit; referenced until done so they aren't
+# garbage collected mid-flight
+_activation_tasks: set[asyncio.Task] = set()
+
+
+async def mark_active(jti: str, ttl_seconds: int) -> None:
+    """
+    Record a newly issued refresh token, by its jti, as active.
+
+    Best effort: if Redis is unavailable the token is simply validated
+    against the database on refresh.
+    """
+    try:
+        redis = await get_async_redis()
+        await redis.set(ACTIVE_KEY_PREFIX + jti, 1, ex=max(1, ttl_seconds))
+    except Exception as e:
+        logger.warning("token_activation_failed", error=str(e))
+
+
+def mark_active_after_commit(db: AsyncSession, jti: str, ttl_seconds: int) -> None:
+    """
+    Mark a refresh token active once db's transaction commits.
+
+    Marking it earlier would leave a token that refreshes from Redis with no
+    stored row behind it, and so can't be revoked, if the commit fails.
+    """
+    pending = db.sync_session.info.setdefault(_PENDING_ACTIVATIONS, [])
+    pending.append((jti, ttl_seconds))
+
+
+@event.listens_for(Session, "after_commit")
+def _activate_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_ACTIVATIONS, ())
+    if not pending:
+        return
+    # Commit hooks can't await, so the Redis writes run as tasks on the loop.
+    # Until one lands the token is simply checked against the database.
+    loop = asyncio.get_running_loop()
+    for jti, ttl_seconds in pending:
+        task = loop.create_task(mark_active(jti, ttl_seconds))
+        _activation_tasks.add(task)
+        task.add_done_callback(_activation_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_ACTIVATIONS, None)
+
+
+async def clear_active(jti: str) -> None:
+    """
+    Remove a refresh token's active marker when it is revoked.
+
+    Raises if Redis is unavailable, so the caller's database revocation is
+    rolled back rather than leaving the token accepted by the Redis fast path.
+    """
+    redis = await get_async_redis()
+    await redis.delete(ACTIVE_KEY_PREFIX + jti)
+
+
+async def is_active(jti: str) -> bool:
+    """
+    Check whether the refresh token with this jti is known to be active.
+
+    Returns False when the marker is missing or Redis is unavailable; the
+    caller then has to check the database.
+    """
+    try:
+        redis = await get_async_redis()
+        return bool(await redis.exists(ACTIVE_KEY_PREFIX + jti))
+    except Exception as e:
+        logger.warning("revocation_check_failed", error=str(e))
+        return False
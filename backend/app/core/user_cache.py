@@ -0,0 +1,129 @@
+# backend/app/core/user_cache.py
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from cachetools import TTLCache
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import async_session_factory
+from app.models.user import User
+
+# Snapshots of recently authenticated users, keyed by user id. Writers of
+# snapshot fields call invalidate_user(); other processes catch up within
+# the TTL. Only touched from the event loop, so no lock is needed.
+USER_CACHE_TTL_SECONDS = 5
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+
+# The refresh path only needs the user's id and email, which nothing in the
+# app changes, so it can keep its snapshots much longer.
+REFRESH_USER_CACHE_TTL_SECONDS = 60
+_refresh_user_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=REFRESH_USER_CACHE_TTL_SECONDS
+)
+
+# Session.info key for user ids to invalidate once the transaction commits
+_PENDING_INVALIDATIONS = "user_cache_invalidations"
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    Read-only snapshot of the authenticated user.
+
+    Detached from any database session and cached for a few seconds, so
+    only the fields below are available and changes are never persisted.
+    Handlers that modify the user or need other columns must depend on
+    get_current_user_full instead.
+    """
+
+    id: str
+    email: str
+    name: str
+    avatar_url: str | None
+    plan: str
+    created_at: datetime
+
+
+# Column projection for AuthenticatedUser: no ORM hydration, identity-map
+# registration or relationship setup on the auth path.
+_user_snapshot_query = select(
+    User.id,
+    User.email,
+    User.name,
+    User.avatar_url,
+    User.plan,
+    User.created_at,
+)
+
+
+async def _load_user_snapshot(
+    db: AsyncSession, user_id: str, cache: TTLCache
+) -> AuthenticatedUser | None:
+    cached = cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(_user_snapshot_query.where(User.id == user_id))
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    snapshot = AuthenticatedUser(**row._asdict())
+    cache[user_id] = snapshot
+    return snapshot
+
+
+async def get_user_snapshot(db: AsyncSession, user_id: str) -> AuthenticatedUser | None:
+    """
+    Return the cached snapshot of a user, loading it from the database on a
+    miss. Returns None if the user doesn't exist.
+    """
+    return await _load_user_snapshot(db, user_id, _user_cache)
+
+
+async def get_refresh_user_snapshot(
+    db: AsyncSession, user_id: str
+) -> AuthenticatedUser | None:
+    """
+    Like get_user_snapshot, but cached for up to a minute. Only id and email
+    may be relied on; use it where nothing else of the user is read.
+    """
+    return await _load_user_snapshot(db, user_id, _refresh_user_cache)
+
+
+def invalidate_user(db: AsyncSession, user_id: str) -> None:
+    """
+    Drop a user's cached snapshots once db's transaction commits.
+
+    Dropping them earlier would let a concurrent request cache the old row
+    again before the change is visible to it.
+    """
+    db.sync_session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        _user_cache.pop(user_id, None)
+        _refresh_user_cache.pop(user_id, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+async def warm_up_user_snapshot_query() -> None:
+    """
+    Compile and prepare the snapshot query once at startup, so the first
+    authenticated requests don't pay for SQL compilation.
+    """
+    async with async_session_factory() as session:
+        await session.execute(
+            _user_snapshot_query.where(
+                User.id == "00000000-0000-0000-0000-000000000000"
+            )
+        )
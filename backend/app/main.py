@@ -5,17 +5,20 @@ from contextlib import asynccontextmanager
 
 import structlog as structlog_module
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 
 from app.core.config import settings
+from app.core.cors import FrontendCORSMiddleware
 from app.core.database import engine
 from app.core.exceptions import (
     SynthFlowException,
     generic_exception_handler,
     synthflow_exception_handler,
 )
+from app.core.http_clients import close_http_clients, init_http_clients
 from app.core.logging import generate_request_id, setup_logging
+from app.core.user_cache import warm_up_user_snapshot_query
 from app.routers import artifacts, auth, billing, executions, webhooks, workflows, ws
 from app.routers import settings as settings_router
 
@@ -25,10 +28,12 @@ logger = structlog_module.get_logger()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.execute(text("SELECT 1"))
+    await _ping_database()
+    await warm_up_user_snapshot_query()
     logger.info("database_connected", app=settings.APP_NAME)
+    await init_http_clients()
     yield
+    await close_http_clients()
     await engine.dispose()
     logger.info("shutdown_complete", app=settings.APP_NAME)
 
@@ -57,6 +62,7 @@ Connect to `ws(s)://host/ws/runs/{run_id}?token={jwt}` for real-time execution u
 """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_tags=[
@@ -94,13 +100,7 @@ app.add_exception_handler(SynthFlowException, synthflow_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 # --- Middleware ---
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[settings.FRONTEND_URL],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FrontendCORSMiddleware, allow_origin=settings.FRONTEND_URL)
 
 
 @app.middleware("http")
@@ -109,10 +109,10 @@ async def request_logging_middleware(request: Request, call_next):
     structlog_module.contextvars.clear_contextvars()
     structlog_module.contextvars.bind_contextvars(request_id=request_id)
 
-    start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
 
     response = await call_next(request)
-    duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
     # Skip logging for health checks to reduce noise
     if not request.url.path.startswith("/api/health"):
@@ -151,14 +151,30 @@ async def root():
     }
 
 
+# Health responses are memoized briefly so burst probing doesn't hammer the DB
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: tuple[float, dict] | None = None
+
+
+async def _ping_database() -> None:
+    """Run SELECT 1 in autocommit mode: one round-trip, no BEGIN/COMMIT."""
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("SELECT 1"))
+
+
 @app.get("/api/health")
 async def health_check():
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and _health_cache[0] > now:
+        return _health_cache[1]
+
     checks = {"api": "healthy", "database": "unhealthy", "redis": "unhealthy"}
 
     # Check database
     try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+        await _ping_database()
         checks["database"] = "healthy"
     except Exception as e:
         checks["database"] = f"unhealthy: {str(e)}"
@@ -174,10 +190,12 @@ async def health_check():
         checks["redis"] = f"unhealthy: {str(e)}"
 
     is_healthy = all(v == "healthy" for v in checks.values())
-    return {
+    response = {
         "status": "healthy" if is_healthy else "degraded",
         "checks": checks,
     }
+    _health_cache = (now + HEALTH_CACHE_TTL_SECONDS, response)
+    return response
 
 
 @app.get("/api/health/ready")
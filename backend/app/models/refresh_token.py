@@ -2,7 +2,8 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -11,12 +12,25 @@ from app.models.base import TimestampMixin, generate_uuid
 
 class RefreshToken(Base, TimestampMixin):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Covers the refresh lookup (token_hash -> is_revoked, expires_at,
+        # user_id), so it can be answered with an index-only scan.
+        Index(
+            "ix_refresh_tokens_token_hash",
+            "token_hash",
+            unique=True,
+            postgresql_include=["is_revoked", "expires_at", "user_id"],
+        ),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), primary_key=True, default=generate_uuid
+    )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
-    token: Mapped[str] = mapped_column(String(500), unique=True, index=True)
+    # SHA-256 of the refresh token; the token itself is never stored.
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32))
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False)
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
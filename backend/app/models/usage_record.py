@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -60,16 +61,22 @@ class UsageRecord(Base):
 
     __tablename__ = "usage_records"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), primary_key=True, default=generate_uuid
+    )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
     event_type: Mapped[str] = mapped_column(String(50))
     workflow_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("workflows.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False),
+        ForeignKey("workflows.id", ondelete="SET NULL"),
+        nullable=True,
     )
     run_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("workflow_runs.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False),
+        ForeignKey("workflow_runs.id", ondelete="SET NULL"),
+        nullable=True,
     )
     recorded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
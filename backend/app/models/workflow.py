@@ -3,11 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import TimestampMixin, generate_uuid
+from app.models.base import OrjsonJSONB, TimestampMixin, generate_uuid
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -17,13 +17,15 @@ if TYPE_CHECKING:
 class Workflow(Base, TimestampMixin):
     __tablename__ = "workflows"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), primary_key=True, default=generate_uuid
+    )
     owner_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    graph_data: Mapped[dict] = mapped_column(JSONB, default=dict)
+    graph_data: Mapped[dict] = mapped_column(OrjsonJSONB, default=dict)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     # Concurrency behavior for workflow runs. Valid values:
     # - "allow_parallel": allow multiple runs of the same workflow to execute in parallel.
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -18,9 +18,11 @@ if TYPE_CHECKING:
 class WorkflowRun(Base, TimestampMixin):
     __tablename__ = "workflow_runs"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), primary_key=True, default=generate_uuid
+    )
     workflow_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("workflows.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=False), ForeignKey("workflows.id", ondelete="CASCADE"), index=True
     )
     workflow_version: Mapped[int] = mapped_column(Integer)
     status: Mapped[str] = mapped_column(String(50), default="pending", index=True)
@@ -4,9 +4,8 @@ import structlog
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 
-from app.core.dependencies import get_current_user
+from app.core.dependencies import AuthenticatedUser, ResourceId, get_current_user
 from app.core.exceptions import BadRequestException, NotFoundException
-from app.models.user import User
 from app.services.storage_service import (
     download_artifact,
     get_artifact_url,
@@ -23,7 +22,7 @@ async def get_artifact_download_url(
     key: str = Query(
         description="Artifact key (e.g., artifacts/run_id/node_id/output.json)"
     ),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
     Get a download URL for an artifact.
@@ -55,7 +54,7 @@ async def get_artifact_download_url(
 @router.get("/download")
 async def download_artifact_direct(
     key: str = Query(description="Artifact key"),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
     Download an artifact directly.
@@ -80,8 +79,8 @@ async def download_artifact_direct(
 
 @router.get("/{run_id}")
 async def list_run_artifacts(
-    run_id: str,
-    current_user: User = Depends(get_current_user),
+    run_id: ResourceId,
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
     List all artifacts for a workflow run.
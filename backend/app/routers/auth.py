@@ -3,9 +3,10 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.config import ACCESS_TOKEN_EXPIRE_SECONDS
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.responses import UTCJSONResponse
 from app.models.user import User
 from app.schemas.auth import (
     AuthResponse,
@@ -30,11 +31,14 @@ async def google_login(
         db, data.credential
     )
 
-    return AuthResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse.model_validate(user),
+    return UTCJSONResponse(
+        {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+            "expires_in": ACCESS_TOKEN_EXPIRE_SECONDS,
+            "user": _user_response(user),
+        }
     )
 
 
@@ -50,7 +54,7 @@ async def refresh_token(
 
     return RefreshResponse(
         access_token=new_access_token,
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        expires_in=ACCESS_TOKEN_EXPIRE_SECONDS,
     )
 
 
@@ -66,7 +70,23 @@ async def logout(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """Get the currently authenticated user's profile."""
-    return UserResponse.model_validate(current_user)
+    return UTCJSONResponse(_user_response(current_user))
+
+
+def _user_response(user: User | AuthenticatedUser) -> dict:
+    """
+    Build the UserResponse fields from trusted data. Handlers return them in
+    a UTCJSONResponse, so FastAPI neither builds nor validates a model; the
+    response_model only documents the shape.
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "avatar_url": user.avatar_url,
+        "plan": user.plan,
+        "created_at": user.created_at,
+    }
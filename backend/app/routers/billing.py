@@ -1,6 +1,5 @@
 # backend/app/routers/billing.py
 
-import stripe
 import structlog
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
@@ -8,10 +7,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import async_session_factory, get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import (
+    AuthenticatedUser,
+    get_current_user,
+    get_current_user_full,
+)
 from app.models.user import User
 from app.schemas.billing import BillingUsageResponse, CheckoutResponse, PortalResponse
-from app.services import stripe_service, usage_service
+from app.services import usage_service
 
 logger = structlog.get_logger()
 
@@ -20,7 +23,7 @@ router = APIRouter(prefix="/api/billing", tags=["Billing"])
 
 @router.get("/usage", response_model=BillingUsageResponse)
 async def get_usage(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get current billing cycle usage and limits."""
@@ -30,10 +33,12 @@ async def get_usage(
 
 @router.post("/create-checkout-session", response_model=CheckoutResponse)
 async def create_checkout(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_full),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a Stripe Checkout session for upgrading to Pro."""
+    from app.services import stripe_service
+
     if current_user.plan == "pro":
         from app.core.exceptions import BadRequestException
 
@@ -51,10 +56,12 @@ async def create_checkout(
 
 @router.post("/create-portal-session", response_model=PortalResponse)
 async def create_portal(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_full),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a Stripe Customer Portal session for managing subscription."""
+    from app.services import stripe_service
+
     portal_url = await stripe_service.create_portal_session(
         db=db,
         user=current_user,
@@ -72,6 +79,10 @@ async def stripe_webhook(request: Request):
     This endpoint is called by Stripe when subscription events occur.
     It verifies the webhook signature and processes the event.
     """
+    import stripe
+
+    from app.services import stripe_service
+
     payload = await request.body()
     sig_header = request.headers.get("stripe-signature", "")
 
@@ -5,8 +5,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.dependencies import AuthenticatedUser, ResourceId, get_current_user
 from app.models.workflow_run import WorkflowRun
 from app.schemas.execution import (
     ExecuteWorkflowRequest,
@@ -26,9 +25,9 @@ router = APIRouter(prefix="/api", tags=["Execution"])
     status_code=202,
 )
 async def execute_workflow(
-    workflow_id: str,
+    workflow_id: ResourceId,
     data: ExecuteWorkflowRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -77,8 +76,8 @@ async def execute_workflow(
 
 @router.get("/runs/{run_id}", response_model=RunDetailResponse)
 async def get_run(
-    run_id: str,
-    current_user: User = Depends(get_current_user),
+    run_id: ResourceId,
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -102,11 +101,11 @@ async def get_run(
     response_model=RunListResponse,
 )
 async def list_workflow_runs(
-    workflow_id: str,
+    workflow_id: ResourceId,
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
     status: str | None = Query(default=None),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user_full
 from app.core.encryption import decrypt_value, encrypt_value
 from app.models.user import User
 from app.schemas.settings import (
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/api/settings", tags=["Settings"])
 
 @router.get("/api-keys", response_model=APIKeyStatusResponse)
 async def get_api_key_status(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_full),
 ):
     """
     Check which API keys are configured.
@@ -41,7 +41,7 @@ async def get_api_key_status(
 @router.put("/api-keys/openai", response_model=APIKeyStatusResponse)
 async def update_openai_key(
     data: UpdateAPIKeyRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_full),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -71,7 +71,7 @@ async def update_openai_key(
 
 @router.delete("/api-keys/openai", response_model=APIKeyStatusResponse)
 async def delete_openai_key(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_full),
     db: AsyncSession = Depends(get_db),
 ):
     """Remove the user's stored OpenAI API key."""
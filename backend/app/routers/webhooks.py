@@ -6,12 +6,12 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import select
 
 from app.core.database import async_session_factory
+from app.core.dependencies import ResourceId
 from app.core.exceptions import BadRequestException, NotFoundException
 from app.core.rate_limiter import check_rate_limit
 from app.models.usage_record import UsageRecord
 from app.models.workflow import Workflow
 from app.models.workflow_run import WorkflowRun
-from app.worker.tasks import execute_workflow_run_task
 
 logger = structlog.get_logger()
 
@@ -23,7 +23,7 @@ WEBHOOK_RATE_WINDOW = 60
 
 
 @router.post("/{workflow_id}", status_code=202)
-async def webhook_trigger(workflow_id: str, request: Request):
+async def webhook_trigger(workflow_id: ResourceId, request: Request):
     """
     Public webhook endpoint - no authentication required.
 
@@ -33,6 +33,8 @@ async def webhook_trigger(workflow_id: str, request: Request):
     Rate limited to 10 requests per minute per workflow.
     Returns 202 Accepted with the run ID.
     """
+    from app.worker.tasks import execute_workflow_run_task
+
     # Rate limiting
     rate_key = f"webhook_rate:{workflow_id}"
     is_allowed, rate_info = await check_rate_limit(
@@ -147,7 +149,6 @@ async def webhook_trigger(workflow_id: str, request: Request):
         db.add(usage_record)
 
         await db.commit()
-        await db.refresh(run)
 
         logger.info(
             "webhook_triggered",
@@ -5,12 +5,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.dependencies import AuthenticatedUser, ResourceId, get_current_user
+from app.core.responses import UTCJSONResponse
+from app.models.workflow import Workflow
 from app.schemas.workflow import (
     WorkflowCreate,
     WorkflowCreateResponse,
-    WorkflowListItem,
     WorkflowListResponse,
     WorkflowResponse,
     WorkflowUpdate,
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/api/workflows", tags=["Workflows"])
 @router.post("", response_model=WorkflowCreateResponse, status_code=201)
 async def create_workflow(
     data: WorkflowCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -60,7 +60,7 @@ async def create_workflow(
 async def list_workflows(
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -72,32 +72,18 @@ async def list_workflows(
         db, current_user.id, page, per_page
     )
 
-    items = []
-    for wf in workflows:
-        graph = wf.graph_data or {}
-        node_count = len(graph.get("nodes", []))
-        items.append(
-            WorkflowListItem(
-                id=wf.id,
-                name=wf.name,
-                description=wf.description,
-                is_active=wf.is_active,
-                node_count=node_count,
-                version=wf.version,
-                created_at=wf.created_at,
-                updated_at=wf.updated_at,
-            )
-        )
-
-    return WorkflowListResponse(
-        workflows=items, total=total, page=page, per_page=per_page
+    # Items are already projected to the WorkflowListItem fields: serialize
+    # them with orjson rather than validating a model per row. The
+    # response_model above still documents the shape.
+    return UTCJSONResponse(
+        {"workflows": workflows, "total": total, "page": page, "per_page": per_page}
     )
 
 
 @router.get("/{workflow_id}", response_model=WorkflowResponse)
 async def get_workflow(
-    workflow_id: str,
-    current_user: User = Depends(get_current_user),
+    workflow_id: ResourceId,
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -109,14 +95,14 @@ async def get_workflow(
     workflow = await workflow_service.get_workflow_by_id(
         db, workflow_id, current_user.id
     )
-    return WorkflowResponse.model_validate(workflow)
+    return UTCJSONResponse(_workflow_response(workflow))
 
 
 @router.put("/{workflow_id}", response_model=WorkflowResponse)
 async def update_workflow(
-    workflow_id: str,
+    workflow_id: ResourceId,
     data: WorkflowUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -128,13 +114,13 @@ async def update_workflow(
     workflow = await workflow_service.update_workflow(
         db, workflow_id, current_user.id, data
     )
-    return WorkflowResponse.model_validate(workflow)
+    return UTCJSONResponse(_workflow_response(workflow))
 
 
 @router.delete("/{workflow_id}", status_code=204)
 async def delete_workflow(
-    workflow_id: str,
-    current_user: User = Depends(get_current_user),
+    workflow_id: ResourceId,
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -150,3 +136,23 @@ async def delete_workflow(
     """
     await workflow_service.delete_workflow(db, workflow_id, current_user.id)
     return None
+
+
+def _workflow_response(workflow: Workflow) -> dict:
+    """
+    Build the WorkflowResponse fields from a loaded Workflow. Handlers return
+    them in a UTCJSONResponse, so FastAPI neither builds nor validates a
+    model; the response_model only documents the shape.
+    """
+    return {
+        "id": workflow.id,
+        "owner_id": workflow.owner_id,
+        "name": workflow.name,
+        "description": workflow.description,
+        "graph_data": workflow.graph_data,
+        "is_active": workflow.is_active,
+        "concurrency_policy": workflow.concurrency_policy,
+        "version": workflow.version,
+        "created_at": workflow.created_at,
+        "updated_at": workflow.updated_at,
+    }
@@ -5,7 +5,7 @@ import json
 
 import structlog
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from jose import JWTError
+from jwt import PyJWTError
 
 from app.core.auth import verify_access_token
 from app.core.pubsub import get_async_redis, get_channel_name
@@ -42,7 +42,7 @@ async def run_websocket(websocket: WebSocket, run_id: str):
     try:
         payload = verify_access_token(token)
         user_id = payload.get("sub")
-    except JWTError:
+    except PyJWTError:
         await websocket.close(code=4001, reason="Invalid or expired token")
         return
 
@@ -1,41 +1,131 @@
 # backend/app/services/auth_service.py
 
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
 
 import httpx
+import jwt
 import structlog
-from jose import JWTError
-from sqlalchemy import select
+from cachetools import TTLCache
+from jwt import InvalidAudienceError, PyJWTError
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import token_revocation
 from app.core.auth import (
     create_access_token,
     create_refresh_token,
     verify_refresh_token,
 )
-from app.core.config import settings
+from app.core.config import REFRESH_TOKEN_EXPIRE_SECONDS, settings
 from app.core.exceptions import BadRequestException
+from app.core.http_clients import get_google_client
+from app.core.user_cache import (
+    AuthenticatedUser,
+    get_refresh_user_snapshot,
+    invalidate_user,
+)
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
 
 logger = structlog.get_logger()
 
-# Google's token info endpoint
+# Google's token info endpoint, used when a token can't be verified locally
 GOOGLE_TOKEN_INFO_URL = "https://oauth2.googleapis.com/tokeninfo"
 
+# Google's ID token signing keys (JWKS) and the issuers it signs tokens as
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS = 3600
+
+# Clock skew tolerated on a locally verified token's iat/exp, so a token
+# Google issued a moment "in the future" by our clock isn't rejected
+GOOGLE_TOKEN_LEEWAY_SECONDS = 60
+
+# (expires_at, keys by kid). Refetched once Cache-Control max-age runs out.
+_google_jwks: tuple[float, dict[str, jwt.PyJWK]] = (0.0, {})
+
+# Verified Google ID token payloads, keyed by a hash of the credential so raw
+# credentials are never kept. Entries stop being served EXPIRY_MARGIN seconds
+# before the token itself expires. Only touched from the event loop.
+GOOGLE_TOKEN_CACHE_TTL_SECONDS = 300
+GOOGLE_TOKEN_EXPIRY_MARGIN_SECONDS = 30
+_google_token_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=GOOGLE_TOKEN_CACHE_TTL_SECONDS
+)
 
-async def verify_google_token(credential: str) -> dict:
+
+# Google fetches in progress, so concurrent requests for the same credential
+# (or the signing keys) share one call instead of each making their own.
+_google_inflight: dict[object, asyncio.Task] = {}
+
+
+def _forget_inflight(key: object, task: asyncio.Task) -> None:
+    _google_inflight.pop(key, None)
+    # Mark the exception as retrieved if every waiter went away
+    if not task.cancelled():
+        task.exception()
+
+
+async def _single_flight(key: object, fetch: Callable[[], Awaitable]):
     """
-    Verify a Google ID token by calling Google's tokeninfo endpoint.
+    Run fetch() once per key at a time; concurrent callers await its result.
 
-    Returns the decoded token payload with user info.
-    Raises BadRequestException if token is invalid.
+    Callers are shielded, so a disconnecting client doesn't cancel the fetch
+    for everyone else waiting on it.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            GOOGLE_TOKEN_INFO_URL,
-            params={"id_token": credential},
-        )
+    task = _google_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _google_inflight[key] = task
+        task.add_done_callback(lambda t: _forget_inflight(key, t))
+    return await asyncio.shield(task)
+
+
+def _cache_max_age(cache_control: str) -> int:
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age" and value.isdigit():
+            return int(value)
+    return GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS
+
+
+async def _get_google_signing_keys() -> dict[str, jwt.PyJWK]:
+    """
+    Return Google's signing keys by kid, fetching them only when the cached
+    set has expired. Returns an empty dict if they can't be fetched.
+    """
+    expires_at, keys = _google_jwks
+    if expires_at > time.time():
+        return keys
+
+    return await _single_flight("jwks", _fetch_google_signing_keys)
+
+
+async def _fetch_google_signing_keys() -> dict[str, jwt.PyJWK]:
+    global _google_jwks
+    try:
+        response = await get_google_client().get(GOOGLE_CERTS_URL)
+        response.raise_for_status()
+        jwks = jwt.PyJWKSet.from_dict(response.json())
+    except (httpx.HTTPError, ValueError, PyJWTError) as e:
+        logger.warning("google_certs_fetch_failed", error=str(e))
+        return {}
+
+    keys = {key.key_id: key for key in jwks.keys if key.key_id}
+    max_age = _cache_max_age(response.headers.get("cache-control", ""))
+    _google_jwks = (time.time() + max_age, keys)
+    return keys
+
+
+async def _verify_with_tokeninfo(credential: str) -> dict:
+    response = await get_google_client().get(
+        GOOGLE_TOKEN_INFO_URL,
+        params={"id_token": credential},
+    )
 
     if response.status_code != 200:
         logger.warning("google_token_invalid", status=response.status_code)
@@ -52,10 +142,81 @@ async def verify_google_token(credential: str) -> dict:
         )
         raise BadRequestException("Google token was not issued for this application")
 
-    # Verify email is present and verified
-    if not payload.get("email_verified", False):
+    return payload
+
+
+def _verify_with_key(credential: str, key: jwt.PyJWK) -> dict:
+    try:
+        return jwt.decode(
+            credential,
+            key,
+            algorithms=["RS256"],
+            audience=settings.GOOGLE_CLIENT_ID,
+            issuer=GOOGLE_ISSUERS,
+            leeway=GOOGLE_TOKEN_LEEWAY_SECONDS,
+            options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+        )
+    except InvalidAudienceError:
+        logger.warning(
+            "google_token_wrong_audience", expected=settings.GOOGLE_CLIENT_ID
+        )
+        raise BadRequestException("Google token was not issued for this application")
+    except PyJWTError as e:
+        logger.warning("google_token_invalid", error=str(e))
+        raise BadRequestException("Invalid Google credential")
+
+
+async def verify_google_token(credential: str) -> dict:
+    """
+    Verify a Google ID token.
+
+    The signature, audience, issuer and expiry are checked locally against
+    Google's published signing keys, which are cached for as long as Google
+    allows. If the token's key isn't among them (e.g. during a key rotation),
+    Google's tokeninfo endpoint is asked instead.
+
+    Successful results are cached for up to five minutes, so repeated logins
+    with the same credential skip verification entirely.
+
+    Returns the decoded token payload with user info.
+    Raises BadRequestException if token is invalid.
+    """
+    cache_key = hashlib.sha256(credential.encode()).digest()
+    cached = _google_token_cache.get(cache_key)
+    if cached is not None:
+        payload, cached_until = cached
+        if cached_until > time.time():
+            return payload
+
+    return await _single_flight(
+        cache_key, lambda: _verify_google_token(credential, cache_key)
+    )
+
+
+async def _verify_google_token(credential: str, cache_key: bytes) -> dict:
+    try:
+        kid = jwt.get_unverified_header(credential).get("kid")
+    except PyJWTError:
+        raise BadRequestException("Invalid Google credential")
+
+    key = (await _get_google_signing_keys()).get(kid)
+    if key is not None:
+        payload = _verify_with_key(credential, key)
+    else:
+        payload = await _verify_with_tokeninfo(credential)
+
+    # Verify email is present and verified. tokeninfo returns the claim as
+    # the string "true"/"false", a locally decoded token as a boolean.
+    if str(payload.get("email_verified")).lower() != "true":
         raise BadRequestException("Google email not verified")
 
+    now = time.time()
+    cached_until = min(
+        int(payload.get("exp", 0)) - GOOGLE_TOKEN_EXPIRY_MARGIN_SECONDS,
+        now + GOOGLE_TOKEN_CACHE_TTL_SECONDS,
+    )
+    if cached_until > now:
+        _google_token_cache[cache_key] = (payload, cached_until)
     return payload
 
 
@@ -79,6 +240,7 @@ async def get_or_create_user(
         user.name = google_payload.get("name", user.name)
         user.avatar_url = google_payload.get("picture", user.avatar_url)
         await db.flush()
+        invalidate_user(db, user.id)
         return user, False
 
     # Create new user
@@ -92,26 +254,37 @@ async def get_or_create_user(
     )
     db.add(user)
     await db.flush()
-    await db.refresh(user)
 
     logger.info("user_created", user_id=user.id, email=user.email)
     return user, True
 
 
+def _refresh_token_hash(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
 async def store_refresh_token(
-    db: AsyncSession, user_id: str, token: str
+    db: AsyncSession, user_id: str, token: str, jti: str
 ) -> RefreshToken:
-    """Store a refresh token in the database for later validation and revocation."""
+    """
+    Store a refresh token in the database for later validation and revocation.
+
+    Only its SHA-256 hash is stored, so a database leak exposes no usable tokens.
+    Once the transaction commits, the token's jti is also marked active in
+    Redis, which lets the refresh path skip the database.
+    """
     expires_at = datetime.now(timezone.utc) + timedelta(
         days=settings.REFRESH_TOKEN_EXPIRE_DAYS
     )
     refresh_token = RefreshToken(
         user_id=user_id,
-        token=token,
+        token_hash=_refresh_token_hash(token),
         expires_at=expires_at,
     )
     db.add(refresh_token)
     await db.flush()
+
+    token_revocation.mark_active_after_commit(db, jti, REFRESH_TOKEN_EXPIRE_SECONDS)
     return refresh_token
 
 
@@ -134,12 +307,14 @@ async def authenticate_with_google(
     # Step 2: Get or create user
     user, is_new = await get_or_create_user(db, google_payload)
 
-    # Step 3: Generate tokens
+    # Step 3: Generate tokens. HMAC signing takes microseconds, less than a
+    # threadpool hop, so it stays on the event loop.
     access_token = create_access_token(user.id, user.email)
-    refresh_token = create_refresh_token(user.id)
+    refresh_token, jti = create_refresh_token(user.id)
 
-    # Step 4: Store refresh token
-    await store_refresh_token(db, user.id, refresh_token)
+    # Step 4: Store refresh token. Awaited in the request's transaction: the
+    # database fallback in refresh_access_token must find it right away.
+    await store_refresh_token(db, user.id, refresh_token, jti)
 
     logger.info(
         "user_authenticated",
@@ -152,45 +327,48 @@ async def authenticate_with_google(
 
 async def refresh_access_token(
     db: AsyncSession, refresh_token_str: str
-) -> tuple[User, str]:
+) -> tuple[User | AuthenticatedUser, str]:
     """
     Validate a refresh token and issue a new access token.
 
     Returns (user, new_access_token).
     Raises exception if token is invalid, revoked, or expired.
     """
+    # Every rejection gets the same message, so callers can't tell which
+    # check a token failed.
     # Step 1: Decode the JWT
     try:
         payload = verify_refresh_token(refresh_token_str)
-    except JWTError:
-        raise BadRequestException("Invalid or expired refresh token")
+    except PyJWTError:
+        raise BadRequestException("Invalid refresh token")
 
     user_id = payload["sub"]
 
-    # Step 2: Check token exists in database and is not revoked
-    query = select(RefreshToken).where(
-        RefreshToken.token == refresh_token_str,
-        RefreshToken.is_revoked.is_(False),
-    )
-    result = await db.execute(query)
-    stored_token = result.scalar_one_or_none()
-
-    if stored_token is None:
-        raise BadRequestException("Refresh token not found or has been revoked")
-
-    # Step 3: Check expiry
-    if stored_token.expires_at < datetime.now(timezone.utc):
-        raise BadRequestException("Refresh token has expired")
-
-    # Step 4: Fetch user
-    user_query = select(User).where(User.id == user_id)
-    result = await db.execute(user_query)
-    user = result.scalar_one_or_none()
+    # Step 2: Check revocation. Tokens marked active in Redis by jti need
+    # only the user. Otherwise (marker evicted, Redis down, or a token issued
+    # before jti was added) fetch the user of a stored, unrevoked and
+    # unexpired token in one query.
+    jti = payload.get("jti")
+    if jti and await token_revocation.is_active(jti):
+        # Step 3: Fetch user, usually from the snapshot cache
+        user = await get_refresh_user_snapshot(db, user_id)
+    else:
+        query = (
+            select(User)
+            .join(RefreshToken, RefreshToken.user_id == User.id)
+            .where(
+                RefreshToken.token_hash == _refresh_token_hash(refresh_token_str),
+                RefreshToken.is_revoked.is_(False),
+                RefreshToken.expires_at > func.now(),
+            )
+        )
+        result = await db.execute(query)
+        user = result.scalar_one_or_none()
 
     if user is None:
-        raise BadRequestException("User not found")
+        raise BadRequestException("Invalid refresh token")
 
-    # Step 5: Issue new access token
+    # Step 4: Issue new access token
     new_access_token = create_access_token(user.id, user.email)
 
     logger.info("token_refreshed", user_id=user.id)
@@ -201,13 +379,25 @@ async def revoke_refresh_token(db: AsyncSession, refresh_token_str: str) -> None
     """
     Revoke a refresh token (logout).
 
-    Silently succeeds even if token is not found (idempotent).
+    Silently succeeds even if token is not found (idempotent). The token's
+    active marker is also removed from Redis, which the refresh path checks
+    first.
     """
-    query = select(RefreshToken).where(RefreshToken.token == refresh_token_str)
+    query = select(RefreshToken).where(
+        RefreshToken.token_hash == _refresh_token_hash(refresh_token_str)
+    )
     result = await db.execute(query)
     stored_token = result.scalar_one_or_none()
 
     if stored_token is not None:
         stored_token.is_revoked = True
         await db.flush()
+
+        # An expired token can't be verified, but its marker has expired too
+        try:
+            jti = verify_refresh_token(refresh_token_str).get("jti")
+        except PyJWTError:
+            jti = None
+        if jti:
+            await token_revocation.clear_active(jti)
         logger.info("token_revoked", user_id=stored_token.user_id)
@@ -86,7 +86,6 @@ async def create_workflow_run(
     )
     db.add(run)
     await db.flush()
-    await db.refresh(run)
 
     logger.info(
         "workflow_run_created",
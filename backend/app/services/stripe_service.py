@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.exceptions import BadRequestException
+from app.core.user_cache import invalidate_user
 from app.models.user import User
 
 logger = structlog.get_logger()
@@ -202,6 +203,7 @@ async def _handle_checkout_completed(db: AsyncSession, session: dict) -> None:
 
     user.plan = "pro"
     await db.flush()
+    invalidate_user(db, user.id)
 
     logger.info(
         "user_upgraded_to_pro",
@@ -231,6 +233,7 @@ async def _handle_subscription_updated(db: AsyncSession, subscription: dict) ->
         user.plan = "free"
 
     await db.flush()
+    invalidate_user(db, user.id)
 
     logger.info(
         "subscription_updated",
@@ -252,6 +255,7 @@ async def _handle_subscription_deleted(db: AsyncSession, subscription: dict) ->
 
     user.plan = "free"
     await db.flush()
+    invalidate_user(db, user.id)
 
     logger.info("user_downgraded_to_free", user_id=user.id)
 
@@ -1,6 +1,6 @@
 # backend/app/services/workflow_service.py
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenException, NotFoundException
@@ -20,32 +20,58 @@ async def create_workflow(
     )
     db.add(workflow)
     await db.flush()
-    await db.refresh(workflow)
     return workflow
 
 
 async def get_workflows(
     db: AsyncSession, owner_id: str, page: int = 1, per_page: int = 20
-) -> tuple[list[Workflow], int]:
-    # Count total
-    count_query = (
-        select(func.count()).select_from(Workflow).where(Workflow.owner_id == owner_id)
-    )
-    result = await db.execute(count_query)
-    total = result.scalar_one()
-
-    # Fetch page
+) -> tuple[list[dict], int]:
+    """
+    Fetch one page of list-view items for an owner, plus the owner's total.
+
+    Items carry the WorkflowListItem fields only; node_count is computed by
+    Postgres so the graph_data blob is never transferred. The total comes
+    back on every row via count(*) OVER (), so one query serves both.
+    """
     offset = (page - 1) * per_page
+    node_count = func.coalesce(
+        func.jsonb_array_length(Workflow.graph_data["nodes"]), 0
+    ).label("node_count")
     query = (
-        select(Workflow)
+        select(
+            func.count().over().label("total"),
+            Workflow.id,
+            Workflow.name,
+            Workflow.description,
+            Workflow.is_active,
+            node_count,
+            Workflow.version,
+            Workflow.created_at,
+            Workflow.updated_at,
+        )
         .where(Workflow.owner_id == owner_id)
         .order_by(Workflow.created_at.desc())
         .offset(offset)
         .limit(per_page)
     )
     result = await db.execute(query)
-    workflows = list(result.scalars().all())
-
+    fields = list(result.keys())[1:]
+    rows = result.all()
+
+    if rows:
+        total = rows[0][0]
+    elif offset == 0:
+        total = 0
+    else:
+        # Past the last page there is no row to read the total from
+        count_query = (
+            select(func.count())
+            .select_from(Workflow)
+            .where(Workflow.owner_id == owner_id)
+        )
+        total = (await db.execute(count_query)).scalar_one()
+
+    workflows = [dict(zip(fields, row[1:])) for row in rows]
     return workflows, total
 
 
@@ -68,22 +94,28 @@ async def get_workflow_by_id(
 async def update_workflow(
     db: AsyncSession, workflow_id: str, owner_id: str, data: WorkflowUpdate
 ) -> Workflow:
-    workflow = await get_workflow_by_id(db, workflow_id, owner_id)
+    # Only the fields the client sent. graph_data is bound as the Pydantic
+    # model and serialized by the column type; RETURNING loads it back as a
+    # dict.
+    update_data = {field: getattr(data, field) for field in data.model_fields_set}
 
-    update_data = data.model_dump(exclude_unset=True)
-
-    # Convert graph_data from Pydantic model to dict if present
-    if "graph_data" in update_data and data.graph_data is not None:
-        update_data["graph_data"] = data.graph_data.model_dump()
-
-    for field, value in update_data.items():
-        setattr(workflow, field, value)
+    # One UPDATE ... RETURNING: the ownership check, the change and the
+    # version increment on every save happen atomically in Postgres.
+    query = (
+        update(Workflow)
+        .where(Workflow.id == workflow_id, Workflow.owner_id == owner_id)
+        .values(**update_data, version=Workflow.version + 1)
+        .returning(Workflow)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    result = await db.execute(query)
+    workflow = result.scalar_one_or_none()
 
-    # Increment version on every save
-    workflow.version += 1
+    if workflow is None:
+        # Nothing updated: report whether it's missing or someone else's
+        await get_workflow_by_id(db, workflow_id, owner_id)
+        raise NotFoundException("Workflow", workflow_id)
 
-    await db.flush()
-    await db.refresh(workflow)
     return workflow
 
 
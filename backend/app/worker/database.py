@@ -20,6 +20,8 @@ _sync_engine = create_engine(
     pool_size=3,
     max_overflow=5,
     pool_pre_ping=True,
+    # Same compiled-SQL cache size as the API engine (SQLAlchemy default: 500)
+    query_cache_size=1200,
 )
 
 _sync_session_factory = sessionmaker(
@@ -275,16 +275,18 @@ async def seed(user_email: str):
 
         print(f"Seeding demo workflows for: {user.email}")
 
+        # One query for the demo names this user already has
+        existing = await db.execute(
+            select(Workflow.name).where(
+                Workflow.owner_id == user.id,
+                Workflow.name.in_([demo["name"] for demo in DEMO_WORKFLOWS]),
+            )
+        )
+        existing_names = set(existing.scalars().all())
+
         created = 0
         for demo in DEMO_WORKFLOWS:
-            # Check if already exists
-            existing = await db.execute(
-                select(Workflow).where(
-                    Workflow.owner_id == user.id,
-                    Workflow.name == demo["name"],
-                )
-            )
-            if existing.scalar_one_or_none():
+            if demo["name"] in existing_names:
                 print(f"  SKIP: '{demo['name']}' already exists")
                 continue
 